@@ -1,23 +1,49 @@
 #!/usr/bin/env python3
 
 import requests
+from urllib3.util.retry import Retry
 import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+import asyncio
 import csv
+import gzip
+import sys
 import time
-import uuid
+import itertools
 import os
 import configparser
+import copy
+import operator
+import threading
+from collections import ChainMap, Counter, defaultdict
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 import logging
 from datetime import datetime
 from rich.console import Console
-from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from rich.panel import Panel
-from rich import box
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+DEBUG_ENABLED = logging.getLogger().isEnabledFor(logging.DEBUG)
 
 
 class ConfigManager:
@@ -26,74 +52,126 @@ class ConfigManager:
         if not Path(config_file).exists():
             raise FileNotFoundError(f"Fichier de configuration non trouve: {config_file}")
         self.config.read(config_file)
-    
+        self._cache = {}
+        self._env_keys = {}
+
+    def _env_value(self, section: str, key: str) -> Optional[str]:
+        env_key = self._env_keys.get((section, key))
+        if env_key is None:
+            env_key = f"CATO_{section.upper()}_{key.upper()}"
+            self._env_keys[(section, key)] = env_key
+        return os.environ.get(env_key)
+
     def get(self, section: str, key: str, fallback: Any = None) -> str:
-        env_key = f"CATO_{section.upper()}_{key.upper()}"
-        env_value = os.environ.get(env_key)
+        cache_key = (section, key, 'str')
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+        env_value = self._env_value(section, key)
         if env_value:
-            return env_value
-        return self.config.get(section, key, fallback=fallback)
-    
+            value = env_value
+        else:
+            value = self.config.get(section, key, fallback=fallback)
+        self._cache[cache_key] = value
+        return value
+
     def getboolean(self, section: str, key: str, fallback: bool = False) -> bool:
-        env_key = f"CATO_{section.upper()}_{key.upper()}"
-        env_value = os.environ.get(env_key)
+        cache_key = (section, key, 'bool')
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+        env_value = self._env_value(section, key)
         if env_value:
-            return env_value.lower() in ('true', '1', 'yes', 'on')
-        return self.config.getboolean(section, key, fallback=fallback)
-    
+            value = env_value.lower() in ('true', '1', 'yes', 'on')
+        else:
+            value = self.config.getboolean(section, key, fallback=fallback)
+        self._cache[cache_key] = value
+        return value
+
     def getfloat(self, section: str, key: str, fallback: float = 0.0) -> float:
-        env_key = f"CATO_{section.upper()}_{key.upper()}"
-        env_value = os.environ.get(env_key)
+        cache_key = (section, key, 'float')
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+        env_value = self._env_value(section, key)
         if env_value:
-            return float(env_value)
-        return self.config.getfloat(section, key, fallback=fallback)
+            value = float(env_value)
+        else:
+            value = self.config.getfloat(section, key, fallback=fallback)
+        self._cache[cache_key] = value
+        return value
 
 
 class HTTPLogger:
     def __init__(self, log_file: Path, enabled: bool = True):
         self.enabled = enabled
         self.log_file = log_file
-        self.logs = []
-    
-    def log_request_response(self, request_id: str, request_data: Dict, response_data: Dict, 
+        self._lock = threading.Lock()
+        self._fh = open(log_file, 'a', encoding='utf-8', buffering=1 << 16) if enabled else None
+        self._count = 0
+        self._error_count = 0
+        self._duration_sum = 0.0
+        self._duration_min = None
+        self._duration_max = None
+
+    def log_request_response(self, request_id: str, request_data: Dict, response_data: Dict,
                             duration: float, error: Optional[str] = None):
         if not self.enabled:
             return
-        self.logs.append({
+        entry = {
             "request_id": request_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "duration_seconds": round(duration, 3),
             "request": request_data,
             "response": response_data,
             "error": error
-        })
-    
+        }
+        if orjson is not None:
+            line = orjson.dumps(entry).decode('utf-8')
+        else:
+            line = json.dumps(entry, separators=(',', ':'), ensure_ascii=False)
+        with self._lock:
+            self._fh.write(line)
+            self._fh.write('\n')
+            self._count += 1
+            if error:
+                self._error_count += 1
+            self._duration_sum += duration
+            if self._duration_min is None or duration < self._duration_min:
+                self._duration_min = duration
+            if self._duration_max is None or duration > self._duration_max:
+                self._duration_max = duration
+
     def save(self):
-        if not self.enabled or not self.logs:
+        if self._fh is None:
             return
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "generated_at": datetime.now().isoformat(),
-                "total_requests": len(self.logs),
-                "logs": self.logs
-            }, f, indent=2, ensure_ascii=False)
-    
+        with self._lock:
+            self._fh.flush()
+            self._fh.close()
+            self._fh = None
+
     def get_stats(self) -> Dict:
-        if not self.logs:
+        if self._count == 0:
             return {}
-        durations = [log['duration_seconds'] for log in self.logs]
-        errors = [log for log in self.logs if log.get('error')]
         return {
-            "total_requests": len(self.logs),
-            "successful_requests": len(self.logs) - len(errors),
-            "failed_requests": len(errors),
-            "total_duration": round(sum(durations), 2),
-            "avg_duration": round(sum(durations) / len(durations), 3),
-            "min_duration": round(min(durations), 3),
-            "max_duration": round(max(durations), 3)
+            "total_requests": self._count,
+            "successful_requests": self._count - self._error_count,
+            "failed_requests": self._error_count,
+            "total_duration": round(self._duration_sum, 2),
+            "avg_duration": round(self._duration_sum / self._count, 3),
+            "min_duration": round(self._duration_min, 3),
+            "max_duration": round(self._duration_max, 3)
         }
 
 
+class PreparedQuery:
+    __slots__ = ('query', 'query_bytes')
+
+    def __init__(self, query: str):
+        self.query = query
+        if orjson is not None:
+            self.query_bytes = orjson.dumps(query)
+        else:
+            self.query_bytes = json.dumps(query, ensure_ascii=False).encode('utf-8')
+
+
 class CatoGraphQLClient:
     def __init__(self, api_key: str, account_id: str, api_url: str, 
                  timeout: int = 30, http_logger: Optional[HTTPLogger] = None):
@@ -102,60 +180,178 @@ class CatoGraphQLClient:
         self.timeout = timeout
         self.http_logger = http_logger
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=["POST"]
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._rid = itertools.count()
         self.session.headers.update({
             "Content-Type": "application/json",
+            "Connection": "keep-alive",
             "x-api-key": api_key
         })
-    
+
+    def close(self):
+        self.session.close()
+
+    def prepare(self, query: str) -> PreparedQuery:
+        return PreparedQuery(query)
+
     def execute(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
-        request_id = str(uuid.uuid4())[:8]
-        console.print(f"[cyan]Request ID: {request_id}[/cyan]")
-        
         payload = {"query": query, "variables": variables or {}}
+        if orjson is not None:
+            body = orjson.dumps(payload)
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        return self._execute_payload(payload, body)
+
+    def execute_prepared(self, prepared: PreparedQuery, variables: Optional[Dict] = None) -> Dict[str, Any]:
+        variables = variables or {}
+        if orjson is not None:
+            variables_bytes = orjson.dumps(variables)
+        else:
+            variables_bytes = json.dumps(variables, ensure_ascii=False).encode('utf-8')
+        body = b'{"query":' + prepared.query_bytes + b',"variables":' + variables_bytes + b'}'
+        return self._execute_payload({"query": prepared.query, "variables": variables}, body)
+
+    def _execute_payload(self, payload: Dict, body: bytes) -> Dict[str, Any]:
+        request_id = f"{next(self._rid):08x}"
+        console.print(f"[cyan]Request ID: {request_id}[/cyan]")
+
         request_data = {
             "url": self.api_url,
             "method": "POST",
             "headers": {"x-api-key": "***" + self.session.headers.get("x-api-key", "")[-4:]},
             "payload": payload
         }
-        
-        start_time = time.time()
+
+        start_time = time.perf_counter()
         error_msg = None
-        response_data = {}
-        
+        log_enabled = self.http_logger is not None and self.http_logger.enabled
+
         try:
-            response = self.session.post(self.api_url, json=payload, timeout=self.timeout)
-            duration = time.time() - start_time
-            
-            try:
-                response_body = response.json()
-            except:
+            response = self.session.post(self.api_url, data=body, timeout=self.timeout)
+            duration = time.perf_counter() - start_time
+
+            content = response.content
+            if content[:1] in (b'{', b'['):
+                response_body = orjson.loads(content) if orjson is not None else json.loads(content)
+            else:
                 response_body = {"raw_text": response.text}
-            
+
             response_data = {
                 "status_code": response.status_code,
+                "http_version": getattr(response.raw, 'version', None),
                 "headers": dict(response.headers),
                 "body": response_body
-            }
-            
+            } if log_enabled else {}
+
             response.raise_for_status()
-            
+
             if "errors" in response_body:
                 error_msg = f"GraphQL errors: {response_body['errors']}"
-                if self.http_logger:
+                if log_enabled:
                     self.http_logger.log_request_response(request_id, request_data, response_data, duration, error_msg)
                 raise Exception(error_msg)
-            
-            if self.http_logger:
+
+            if log_enabled:
                 self.http_logger.log_request_response(request_id, request_data, response_data, duration)
-            
+
             console.print(f"[green]Response: {response.status_code} ({duration:.2f}s)[/green]")
             return response_body
             
         except requests.exceptions.RequestException as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             error_msg = str(e)
-            
+
+            if hasattr(e, 'response') and e.response is not None:
+                try:
+                    error_body = e.response.json()
+                except:
+                    error_body = {"raw_text": e.response.text if hasattr(e.response, 'text') else str(e)}
+                response_data = {
+                    "status_code": e.response.status_code,
+                    "headers": dict(e.response.headers),
+                    "body": error_body,
+                    "error": error_msg
+                }
+            else:
+                response_data = {"status_code": None, "headers": {}, "body": {}, "error": error_msg}
+
+            if self.http_logger:
+                self.http_logger.log_request_response(request_id, request_data, response_data, duration, error_msg)
+
+            console.print(f"[red]Error: {error_msg}[/red]")
+            raise
+
+    def execute_batch(self, items: List) -> List[Dict[str, Any]]:
+        request_id = f"{next(self._rid):08x}"
+        console.print(f"[cyan]Batch Request ID: {request_id} ({len(items)} operations)[/cyan]")
+
+        payload = [{"query": query, "variables": variables or {}, "id": i}
+                  for i, (query, variables) in enumerate(items)]
+        request_data = {
+            "url": self.api_url,
+            "method": "POST",
+            "headers": {"x-api-key": "***" + self.session.headers.get("x-api-key", "")[-4:]},
+            "payload": payload
+        }
+
+        start_time = time.perf_counter()
+
+        log_enabled = self.http_logger is not None and self.http_logger.enabled
+
+        try:
+            if orjson is not None:
+                response = self.session.post(self.api_url, data=orjson.dumps(payload), timeout=self.timeout)
+            else:
+                response = self.session.post(self.api_url, json=payload, timeout=self.timeout)
+            duration = time.perf_counter() - start_time
+
+            content = response.content
+            if content[:1] in (b'{', b'['):
+                response_body = orjson.loads(content) if orjson is not None else json.loads(content)
+            else:
+                response_body = {"raw_text": response.text}
+
+            response_data = {
+                "status_code": response.status_code,
+                "http_version": getattr(response.raw, 'version', None),
+                "headers": dict(response.headers),
+                "body": response_body
+            } if log_enabled else {}
+
+            response.raise_for_status()
+
+            if not isinstance(response_body, list):
+                error_msg = "Le serveur ne supporte pas le batching GraphQL"
+                if log_enabled:
+                    self.http_logger.log_request_response(request_id, request_data, response_data, duration, error_msg)
+                raise Exception(error_msg)
+
+            if log_enabled:
+                self.http_logger.log_request_response(request_id, request_data, response_data, duration)
+
+            console.print(f"[green]Response: {response.status_code} ({duration:.2f}s, {len(response_body)} operations)[/green]")
+
+            ordered = response_body
+            if all(isinstance(item, dict) and 'id' in item for item in response_body):
+                by_id = {item['id']: item for item in response_body}
+                ordered = [by_id.get(i, {}) for i in range(len(items))]
+            return ordered
+
+        except requests.exceptions.RequestException as e:
+            duration = time.perf_counter() - start_time
+            error_msg = str(e)
+
             if hasattr(e, 'response') and e.response is not None:
                 try:
                     error_body = e.response.json()
@@ -177,39 +373,62 @@ class CatoGraphQLClient:
             raise
 
 
+_CSV_CACHE: Dict[tuple, List[Dict]] = {}
+
+
 class CSVDataLoader:
     def __init__(self, csv_path: str):
         self.csv_path = Path(csv_path)
-    
+
     def load_data(self) -> List[Dict]:
         if not self.csv_path.exists():
             raise FileNotFoundError(f"Fichier CSV non trouve: {self.csv_path}")
-        data = []
-        with open(self.csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        cache_key = (str(self.csv_path), self.csv_path.stat().st_mtime_ns)
+        cached = _CSV_CACHE.get(cache_key)
+        if cached is None:
+            cached = list(self.iter_rows())
+            _CSV_CACHE[cache_key] = cached
+        return cached
+
+    def iter_rows(self):
+        if not self.csv_path.exists():
+            raise FileNotFoundError(f"Fichier CSV non trouve: {self.csv_path}")
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
             for row in reader:
-                filtered_row = {k: v for k, v in row.items() if v}
-                data.append(filtered_row)
-        return data
+                yield {header[i]: v for i, v in enumerate(row) if v and i < len(header)}
 
 
 class JSONSequenceLoader:
     def __init__(self, json_path: str):
         self.json_path = Path(json_path)
-    
+        self._debug = DEBUG_ENABLED
+        self._sequence_cache = None
+        self._sequence_mtime = None
+
     def load_sequence(self) -> Dict:
         if not self.json_path.exists():
             raise FileNotFoundError(f"Fichier JSON non trouve: {self.json_path}")
-        
+
+        mtime = self.json_path.stat().st_mtime_ns
+        if self._sequence_cache is not None and self._sequence_mtime == mtime:
+            return self._sequence_cache
+
         with open(self.json_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
         sequence = {
             'master_data_source': data.get('master_data_source', ''),
             'master_iterate_over': data.get('master_iterate_over', ''),
+            'batch_size': int(data.get('batch_size', 0)),
             'steps': []
         }
         
+        self._debug = DEBUG_ENABLED
+
         for idx, step in enumerate(data.get('sequence', []), start=1):
             if not step.get('enabled', True):
                 continue
@@ -217,30 +436,117 @@ class JSONSequenceLoader:
                 'step_name': step.get('step_name', f'step_{idx}'),
                 'operation': step['operation'],
                 'params': step.get('params', {}),
+                'params_compiled': self._compile_params(step.get('params', {})),
                 'wait_seconds': float(step.get('wait_seconds', 1.0)),
                 'store_result_as': step.get('store_result_as', ''),
                 'iterate_over': step.get('iterate_over', ''),
                 'iteration_scope': step.get('iteration_scope', 'global'),
+                'batchable': bool(step.get('batchable', False)),
                 'graphql_query': step.get('graphql_query', ''),
+                '_prepared': PreparedQuery(step['graphql_query']) if step.get('graphql_query') else None,
                 'data_source_file': step.get('data_source_file', ''),
                 'join_on': step.get('join_on', {}),
                 'filter_by': step.get('filter_by', {}),
-                'condition': step.get('condition', {})
+                'condition': step.get('condition', {}),
+                'condition_compiled': self._compile_condition(step.get('condition', {}))
             })
+
+        self._sequence_cache = sequence
+        self._sequence_mtime = mtime
         return sequence
     
+    def _compile_params(self, params: Dict) -> Dict:
+        return {key: self._compile_node(value) for key, value in params.items()}
+
+    def _compile_node(self, value: Any) -> tuple:
+        if isinstance(value, dict):
+            return ('dict', {k: self._compile_node(v) for k, v in value.items()})
+        if isinstance(value, list):
+            return ('list', [self._compile_node(item) for item in value])
+        if isinstance(value, str):
+            if value.startswith('@'):
+                return ('col', value[1:])
+            if value.startswith('${') and value.endswith('}'):
+                return ('var', tuple(value[2:-1].split('.')))
+            return ('literal', value if value and value.strip() else None)
+        return ('literal', value)
+
+    def resolve_compiled(self, compiled: Dict, context: Dict) -> Dict:
+        resolved = {}
+        resolve_leaf = self._resolve_leaf
+        stack = [(compiled, resolved)]
+
+        while stack:
+            nodes, target = stack.pop()
+            if isinstance(target, dict):
+                for key, node in nodes.items():
+                    tag = node[0]
+                    if tag == 'dict':
+                        child = {}
+                        target[key] = child
+                        stack.append((node[1], child))
+                    elif tag == 'list':
+                        child = [None] * len(node[1])
+                        target[key] = child
+                        stack.append((node[1], child))
+                    else:
+                        value = resolve_leaf(node, context)
+                        if value is not None:
+                            target[key] = value
+            else:
+                for i, node in enumerate(nodes):
+                    tag = node[0]
+                    if tag == 'dict':
+                        child = {}
+                        target[i] = child
+                        stack.append((node[1], child))
+                    elif tag == 'list':
+                        child = [None] * len(node[1])
+                        target[i] = child
+                        stack.append((node[1], child))
+                    else:
+                        target[i] = resolve_leaf(node, context)
+
+        return resolved
+
+    def _resolve_leaf(self, node: tuple, context: Dict) -> Any:
+        tag, payload = node
+        if tag == 'literal':
+            return payload
+        if tag == 'col':
+            row = context.get('iteration_row')
+            if row and payload in row:
+                value = row[payload]
+                if value and str(value).strip():
+                    return value
+            elif self._debug:
+                logger.debug("  @%s NOT FOUND", payload)
+            return None
+        if tag == 'var':
+            result = context.get(payload[0])
+            for part in payload[1:]:
+                if isinstance(result, dict):
+                    result = result.get(part)
+                elif isinstance(result, list) and part.isdigit():
+                    idx = int(part)
+                    result = result[idx] if 0 <= idx < len(result) else None
+                else:
+                    return None
+                if result is None:
+                    return None
+            return result
+        return None
+
     def resolve_variables(self, params: Dict, context: Dict, depth: int = 0) -> Dict:
         resolved = {}
-        indent = "  " * depth
-        
+        indent = "  " * depth if self._debug else ""
+
         for key, value in params.items():
             if isinstance(value, dict):
-                if logging.getLogger().isEnabledFor(logging.DEBUG):
-                    console.print(f"[dim]{indent}  Dict: {key}[/dim]")
+                logger.debug("%s  Dict: %s", indent, key)
                 resolved[key] = self.resolve_variables(value, context, depth + 1)
             elif isinstance(value, list):
-                if logging.getLogger().isEnabledFor(logging.DEBUG):
-                    console.print(f"[dim]{indent}  List: {key}[/dim]")
+                logger.debug("%s  List: %s", indent, key)
                 resolved[key] = [
                     self.resolve_variables(item, context, depth + 1) if isinstance(item, dict)
                     else self._resolve_single_value(item, context, f"{key}[{i}]", depth)
@@ -253,20 +559,18 @@ class JSONSequenceLoader:
         return resolved
     
     def _resolve_single_value(self, value: Any, context: Dict, key: str, depth: int = 0) -> Any:
-        indent = "  " * depth
-        
+        indent = "  " * depth if self._debug else ""
+
         if isinstance(value, str):
             if value.startswith('@'):
                 column_name = value[1:]
                 if 'iteration_row' in context and column_name in context['iteration_row']:
                     resolved_value = context['iteration_row'][column_name]
                     if resolved_value and str(resolved_value).strip():
-                        if logging.getLogger().isEnabledFor(logging.DEBUG):
-                            console.print(f"[dim]{indent}  {key}: @{column_name} = {resolved_value}[/dim]")
+                        logger.debug("%s  %s: @%s = %s", indent, key, column_name, resolved_value)
                         return resolved_value
                 else:
-                    if logging.getLogger().isEnabledFor(logging.DEBUG):
-                        console.print(f"[yellow]{indent}  {key}: @{column_name} NOT FOUND[/yellow]")
+                    logger.debug("%s  %s: @%s NOT FOUND", indent, key, column_name)
             
             elif value.startswith('${') and value.endswith('}'):
                 var_name = value[2:-1]
@@ -275,8 +579,7 @@ class JSONSequenceLoader:
                     parts = var_name.split('.')
                     result = context.get(parts[0])
                     
-                    if logging.getLogger().isEnabledFor(logging.DEBUG):
-                        console.print(f"[dim]{indent}  {key}: Resolving ${{{var_name}}}[/dim]")
+                    logger.debug("%s  %s: Resolving ${%s}", indent, key, var_name)
                     
                     if result:
                         for part in parts[1:]:
@@ -294,27 +597,93 @@ class JSONSequenceLoader:
                                 break
                         
                         if result is not None:
-                            if logging.getLogger().isEnabledFor(logging.DEBUG):
-                                console.print(f"[green]{indent}  {key}: ${{{var_name}}} = {result}[/green]")
+                            logger.debug("%s  %s: ${%s} = %s", indent, key, var_name, result)
                             return result
                 else:
                     if var_name in context and context[var_name] is not None:
-                        if logging.getLogger().isEnabledFor(logging.DEBUG):
-                            console.print(f"[green]{indent}  {key}: ${{{var_name}}} = {context[var_name]}[/green]")
+                        logger.debug("%s  %s: ${%s} = %s", indent, key, var_name, context[var_name])
                         return context[var_name]
             else:
                 if value and str(value).strip():
-                    if logging.getLogger().isEnabledFor(logging.DEBUG):
-                        console.print(f"[dim]{indent}  {key}: (static) = {value}[/dim]")
+                    logger.debug("%s  %s: (static) = %s", indent, key, value)
                     return value
         
         elif value is not None:
-            if logging.getLogger().isEnabledFor(logging.DEBUG):
-                console.print(f"[dim]{indent}  {key}: (value) = {value}[/dim]")
+            logger.debug("%s  %s: (value) = %s", indent, key, value)
             return value
         
         return None
     
+    _OPS = {
+        '==': operator.eq,
+        '!=': operator.ne,
+        'in': lambda a, b: a in b if isinstance(b, (list, tuple)) else False,
+        'not_in': lambda a, b: a not in b if isinstance(b, (list, tuple)) else False,
+        'contains': lambda a, b: b in str(a),
+    }
+
+    def _compile_condition(self, condition: Dict) -> Optional[Dict]:
+        if not condition or not condition.get('field'):
+            return None
+
+        field = condition['field']
+        if field.startswith('@'):
+            field_tag, field_key = 'col', field[1:]
+        elif field.startswith('${') and field.endswith('}'):
+            field_tag, field_key = 'var', field[2:-1]
+        else:
+            field_tag, field_key = 'literal', field
+
+        value = condition.get('value')
+        if isinstance(value, str) and value.startswith('@'):
+            value_tag, value_key = 'col', value[1:]
+        else:
+            value_tag, value_key = 'literal', value
+
+        return {
+            'field_tag': field_tag,
+            'field_key': field_key,
+            'value_tag': value_tag,
+            'value_key': value_key,
+            'value_raw': value,
+            'op': self._OPS.get(condition.get('operator', '=='))
+        }
+
+    def evaluate_compiled(self, compiled: Optional[Dict], context: Dict) -> bool:
+        if compiled is None:
+            return True
+
+        field_tag = compiled['field_tag']
+        if field_tag == 'col':
+            row = context.get('iteration_row')
+            if not row or compiled['field_key'] not in row:
+                logger.debug("    Condition field '@%s' not found", compiled['field_key'])
+                return False
+            field_value = row[compiled['field_key']]
+        elif field_tag == 'var':
+            field_value = context.get(compiled['field_key'])
+            if field_value is None:
+                logger.debug("    Condition field '${%s}' not found", compiled['field_key'])
+                return False
+        else:
+            field_value = compiled['field_key']
+
+        if compiled['value_tag'] == 'col':
+            row = context.get('iteration_row')
+            if row and compiled['value_key'] in row:
+                compare_value = row[compiled['value_key']]
+            else:
+                compare_value = compiled['value_raw']
+        else:
+            compare_value = compiled['value_key']
+
+        op = compiled['op']
+        if op is None:
+            return True
+        result = op(field_value, compare_value)
+        logger.debug("    Condition: '%s' vs '%s' = %s", field_value, compare_value, result)
+        return result
+
     def evaluate_condition(self, condition: Dict, context: Dict) -> bool:
         if not condition:
             return True
@@ -331,7 +700,7 @@ class JSONSequenceLoader:
             if 'iteration_row' in context and column_name in context['iteration_row']:
                 field_value = context['iteration_row'][column_name]
             else:
-                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                if self._debug:
                     console.print(f"[yellow]    Condition field '@{column_name}' not found[/yellow]")
                     console.print(f"[yellow]    Available: {list(context.get('iteration_row', {}).keys())}[/yellow]")
                 return False
@@ -339,7 +708,7 @@ class JSONSequenceLoader:
             var_name = field[2:-1]
             field_value = context.get(var_name)
             if field_value is None:
-                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                if self._debug:
                     console.print(f"[yellow]    Condition field '${{{var_name}}}' not found[/yellow]")
                 return False
         else:
@@ -367,20 +736,84 @@ class JSONSequenceLoader:
         else:
             result = True
         
-        if logging.getLogger().isEnabledFor(logging.DEBUG):
+        if self._debug:
             console.print(f"[cyan]    Condition: '{field_value}' {operator} '{compare_value}' = {result}[/cyan]")
         
         return result
 
 
+@dataclass(slots=True)
+class ResultRecord:
+    step_name: str
+    operation: str
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+    params: Dict = field(default_factory=dict)
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+class ResultsWriter:
+    def __init__(self, output_file: Path):
+        self.output_file = output_file
+        self._tmp_file = output_file.with_suffix(output_file.suffix + '.tmp')
+        self._lock = threading.Lock()
+        self._raw = open(self._tmp_file, 'wb', buffering=1 << 18)
+        if output_file.suffix == '.gz':
+            self._fh = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=3)
+        else:
+            self._fh = self._raw
+        self._fh.write(b'[')
+        self._first = True
+        self.count = 0
+
+    def append(self, record: "ResultRecord"):
+        entry = asdict(record)
+        if orjson is not None:
+            line = orjson.dumps(entry)
+        else:
+            line = json.dumps(entry, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        with self._lock:
+            if self._first:
+                self._first = False
+            else:
+                self._fh.write(b',\n')
+            self._fh.write(line)
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            if self._fh is None:
+                return
+            self._fh.write(b']\n')
+            if self._fh is not self._raw:
+                self._fh.close()
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+            self._raw.close()
+            self._fh = None
+            os.replace(self._tmp_file, self.output_file)
+
+
 class ProvisioningOrchestrator:
-    def __init__(self, client: CatoGraphQLClient, config: ConfigManager):
+    def __init__(self, client: CatoGraphQLClient, config: ConfigManager,
+                 results_writer: Optional[ResultsWriter] = None):
         self.client = client
         self.config = config
+        self.results_writer = results_writer
         self.global_context = {}
+        self.concurrency = int(config.getfloat('execution', 'concurrency', fallback=8))
+        self._context_lock = threading.Lock()
+        self._join_cache = {}
+        self._verbose = config.getboolean('display', 'verbose_per_row', fallback=False)
+        self._debug = DEBUG_ENABLED
+        self._batch_size = 0
+        self._array_batch_supported = True
+        self._status_counts = Counter()
     
     def execute_sequence(self, sequence: Dict, loader: JSONSequenceLoader, 
                         data_sources: Dict[str, List[Dict]] = None) -> List[Dict]:
+        from rich.panel import Panel
         console.print(Panel(
             f"[bold cyan]Demarrage du provisionnement[/bold cyan]\n"
             f"[dim]{len(sequence['steps'])} etapes configurees[/dim]",
@@ -391,7 +824,10 @@ class ProvisioningOrchestrator:
         
         results = []
         data_sources = data_sources or {}
-        
+        self._status_counts.clear()
+        self._batch_size = int(sequence.get('batch_size', 0))
+        self._preload_data_sources(sequence['steps'], data_sources)
+
         if sequence.get('master_iterate_over'):
             master_source = sequence['master_iterate_over']
             master_file = sequence.get('master_data_source', '')
@@ -415,22 +851,39 @@ class ProvisioningOrchestrator:
                 console=console
             ) as progress:
                 main_task = progress.add_task("[cyan]Batch...", total=len(master_dataset))
-                
-                for idx, master_row in enumerate(master_dataset, 1):
-                    master_name = master_row.get('name', master_row.get('site_name', f'batch_{idx}'))
-                    
-                    console.print(f"\n[bold blue]{'=' * 80}[/bold blue]")
-                    console.print(f"[bold cyan]BATCH {idx}/{len(master_dataset)}: {master_name}[/bold cyan]")
-                    console.print(f"[bold blue]{'=' * 80}[/bold blue]")
-                    
-                    self.global_context = {'iteration_row': master_row, 'iteration_index': idx}
-                    
-                    if logging.getLogger().isEnabledFor(logging.DEBUG):
-                        console.print(f"[cyan]Starting batch with context: {list(self.global_context.keys())}[/cyan]")
-                    
-                    batch_results = self._execute_steps(sequence['steps'], loader, data_sources, progress)
-                    results.extend(batch_results)
-                    progress.update(main_task, advance=1)
+                parallel_batches = int(self.config.getfloat('execution', 'parallel_batches', fallback=1))
+
+                if parallel_batches > 1:
+                    def run_batch(idx: int, master_row: Dict) -> List[Dict]:
+                        worker = copy.copy(self)
+                        worker.global_context = {'iteration_row': master_row, 'iteration_index': idx}
+                        return worker._execute_steps(sequence['steps'], loader, data_sources, progress)
+
+                    batch_results_by_idx = {}
+                    with ThreadPoolExecutor(max_workers=parallel_batches) as executor:
+                        futures = {executor.submit(run_batch, idx, master_row): idx
+                                  for idx, master_row in enumerate(master_dataset, 1)}
+                        for future in as_completed(futures):
+                            batch_results_by_idx[futures[future]] = future.result()
+                            progress.update(main_task, advance=1)
+                    for idx in sorted(batch_results_by_idx):
+                        results.extend(batch_results_by_idx[idx])
+                else:
+                    for idx, master_row in enumerate(master_dataset, 1):
+                        master_name = master_row.get('name', master_row.get('site_name', f'batch_{idx}'))
+
+                        console.print(f"\n[bold blue]{'=' * 80}[/bold blue]")
+                        console.print(f"[bold cyan]BATCH {idx}/{len(master_dataset)}: {master_name}[/bold cyan]")
+                        console.print(f"[bold blue]{'=' * 80}[/bold blue]")
+
+                        self.global_context = {'iteration_row': master_row, 'iteration_index': idx}
+
+                        if self._debug:
+                            console.print(f"[cyan]Starting batch with context: {list(self.global_context.keys())}[/cyan]")
+
+                        batch_results = self._execute_steps(sequence['steps'], loader, data_sources, progress)
+                        results.extend(batch_results)
+                        progress.update(main_task, advance=1)
         
         else:
             with Progress(
@@ -450,7 +903,32 @@ class ProvisioningOrchestrator:
         
         return results
     
-    def _execute_steps(self, steps: List[Dict], loader: JSONSequenceLoader, 
+    @property
+    def success_count(self) -> int:
+        return self._status_counts['success']
+
+    @property
+    def error_count(self) -> int:
+        return sum(self._status_counts.values()) - self._status_counts['success']
+
+    def _record(self, result: ResultRecord, results: List["ResultRecord"]):
+        with self._context_lock:
+            self._status_counts[result.status] += 1
+        if self.results_writer is not None:
+            self.results_writer.append(result)
+        results.append(result)
+
+    def _preload_data_sources(self, steps: List[Dict], data_sources: Dict):
+        for step in steps:
+            source_name = step.get('iterate_over')
+            source_file = step.get('data_source_file')
+            if not source_name or not source_file or source_name in data_sources:
+                continue
+            if Path(source_file).exists():
+                data_sources[source_name] = CSVDataLoader(source_file).load_data()
+                console.print(f"[cyan]Fichier charge: {source_name} ({len(data_sources[source_name])} entrees)[/cyan]")
+
+    def _execute_steps(self, steps: List[Dict], loader: JSONSequenceLoader,
                       data_sources: Dict, progress: Progress) -> List[Dict]:
         results = []
         
@@ -460,27 +938,23 @@ class ProvisioningOrchestrator:
             console.print(f"[dim]Operation: {step['operation']}[/dim]")
             
             if step.get('condition') and not step.get('iterate_over'):
-                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                if self._debug:
                     console.print(f"[cyan]Evaluating step-level condition...[/cyan]")
-                if not loader.evaluate_condition(step['condition'], self.global_context):
+                if 'condition_compiled' in step:
+                    passed = loader.evaluate_compiled(step['condition_compiled'], self.global_context)
+                else:
+                    passed = loader.evaluate_condition(step['condition'], self.global_context)
+                if not passed:
                     console.print(f"[yellow]Condition non satisfaite - Etape ignoree[/yellow]")
                     continue
             
             if step['iterate_over']:
-                if step.get('data_source_file'):
-                    source_name = step['iterate_over']
-                    source_file = step['data_source_file']
-                    if Path(source_file).exists():
-                        temp_loader = CSVDataLoader(source_file)
-                        data_sources[source_name] = temp_loader.load_data()
-                        console.print(f"[cyan]Fichier charge: {len(data_sources[source_name])} entrees[/cyan]")
-                
                 step_results = self._execute_iteration(step, loader, data_sources, progress)
                 results.extend(step_results)
             else:
                 result = self._execute_single_step(step, loader, self.global_context)
                 if result:
-                    results.append(result)
+                    self._record(result, results)
                     if step['wait_seconds'] > 0:
                         time.sleep(step['wait_seconds'])
         
@@ -507,44 +981,286 @@ class ProvisioningOrchestrator:
             console.print(f"[yellow]Aucun element a traiter[/yellow]")
             return []
         
-        results = []
         iter_task = progress.add_task(f"[yellow]Iteration...", total=len(dataset))
-        
+
+        eligible = []
         for idx, row in enumerate(dataset, 1):
             item_name = row.get('name', row.get('site_name', row.get('lan_name', f'item_{idx}')))
-            progress.update(iter_task, description=f"[yellow]  {item_name}")
-            
-            context = dict(self.global_context)
-            context['iteration_row'] = row
-            context['iteration_index'] = idx
-            
+
             if step.get('condition'):
-                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                if self._debug:
                     console.print(f"  [cyan]Evaluating condition for {item_name}...[/cyan]")
-                if not loader.evaluate_condition(step['condition'], context):
-                    console.print(f"  [yellow]Condition non satisfaite pour {item_name}, ignore[/yellow]")
+                context = ChainMap({'iteration_row': row, 'iteration_index': idx}, self.global_context)
+                if 'condition_compiled' in step:
+                    passed = loader.evaluate_compiled(step['condition_compiled'], context)
+                else:
+                    passed = loader.evaluate_condition(step['condition'], context)
+                if not passed:
+                    if self._verbose:
+                        console.print(f"  [yellow]Condition non satisfaite pour {item_name}, ignore[/yellow]")
                     progress.update(iter_task, advance=1)
                     continue
                 else:
-                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    if self._debug:
                         console.print(f"  [green]Condition satisfaite pour {item_name}[/green]")
-            
+
+            eligible.append((idx, item_name, row))
+
+        if step.get('batchable') and len(eligible) > 1:
+            results = self._execute_rows_batched(step, loader, eligible, progress, iter_task)
+        elif self.concurrency > 1 and len(eligible) > 1:
+            results = self._execute_rows_concurrent(step, loader, eligible, progress, iter_task)
+        else:
+            results = self._execute_rows_sequential(step, loader, eligible, progress, iter_task)
+
+        progress.remove_task(iter_task)
+        return results
+
+    def _execute_rows_sequential(self, step: Dict, loader: JSONSequenceLoader,
+                                 eligible: List, progress: Progress, iter_task) -> List[Dict]:
+        results = []
+
+        for pos, (idx, item_name, row) in enumerate(eligible):
+            progress.update(iter_task, description=f"[yellow]  {item_name}")
+
+            context = ChainMap({'iteration_row': row, 'iteration_index': idx}, self.global_context)
+
             result = self._execute_single_step(step, loader, context, indent=True)
-            
-            if result and result['status'] == 'success':
-                if step['store_result_as']:
-                    self.global_context[step['store_result_as']] = result['result']
-                results.append(result)
-                if idx < len(dataset) and step['wait_seconds'] > 0:
+
+            if result and result.status == 'success':
+                self._record(result, results)
+                if pos < len(eligible) - 1 and step['wait_seconds'] > 0:
                     time.sleep(step['wait_seconds'])
             elif result:
-                results.append(result)
-            
+                self._record(result, results)
+
             progress.update(iter_task, advance=1)
-        
-        progress.remove_task(iter_task)
+
         return results
-    
+
+    def _execute_rows_concurrent(self, step: Dict, loader: JSONSequenceLoader,
+                                 eligible: List, progress: Progress, iter_task) -> List[Dict]:
+        def run_row(idx: int, row: Dict) -> Optional[Dict]:
+            context = ChainMap({'iteration_row': row, 'iteration_index': idx}, self.global_context)
+            return self._execute_single_step(step, loader, context, indent=True)
+
+        results_by_idx = {}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {executor.submit(run_row, idx, row): idx
+                      for idx, item_name, row in eligible}
+            for future in as_completed(futures):
+                idx = futures[future]
+                result = future.result()
+                if result:
+                    results_by_idx[idx] = result
+                progress.update(iter_task, advance=1)
+
+        results = []
+        for idx in sorted(results_by_idx):
+            self._record(results_by_idx[idx], results)
+        return results
+
+    def _execute_rows_batched(self, step: Dict, loader: JSONSequenceLoader,
+                              eligible: List, progress: Progress, iter_task) -> List[Dict]:
+        batch_size = self._batch_size or int(self.config.getfloat('execution', 'max_batch_size', fallback=10))
+        query = step['graphql_query']
+        results = []
+
+        for start in range(0, len(eligible), batch_size):
+            chunk = eligible[start:start + batch_size]
+            items = []
+            for idx, item_name, row in chunk:
+                context = ChainMap({'iteration_row': row, 'iteration_index': idx}, self.global_context)
+                if 'params_compiled' in step:
+                    params = loader.resolve_compiled(step['params_compiled'], context)
+                else:
+                    params = loader.resolve_variables(step['params'], context)
+                params['accountId'] = self.client.account_id
+                items.append((query, params))
+
+            responses = None
+            if self._array_batch_supported:
+                try:
+                    responses = self.client.execute_batch(items)
+                except Exception as e:
+                    if 'batching' in str(e):
+                        console.print("  [yellow]Batching non supporte, bascule en mode unitaire[/yellow]")
+                        self._array_batch_supported = False
+                    else:
+                        console.print(f"  [red]Erreur batch: {e}[/red]")
+                        for (idx, item_name, row), (q, params) in zip(chunk, items):
+                            self._record(ResultRecord(
+                                step_name=step['step_name'],
+                                operation=step['operation'],
+                                status='error',
+                                error=str(e),
+                                params=params
+                            ), results)
+                        progress.update(iter_task, advance=len(chunk))
+                        continue
+
+            if responses is None:
+                responses = []
+                for q, params in items:
+                    try:
+                        responses.append(self.client.execute(q, params))
+                    except Exception as e:
+                        responses.append({'errors': [str(e)]})
+
+            for (idx, item_name, row), (q, params), response in zip(chunk, items, responses):
+                if isinstance(response, dict) and 'errors' in response:
+                    self._record(ResultRecord(
+                        step_name=step['step_name'],
+                        operation=step['operation'],
+                        status='error',
+                        error=f"GraphQL errors: {response['errors']}",
+                        params=params
+                    ), results)
+                else:
+                    if step['store_result_as']:
+                        with self._context_lock:
+                            self.global_context[step['store_result_as']] = response
+                    self._record(ResultRecord(
+                        step_name=step['step_name'],
+                        operation=step['operation'],
+                        status='success',
+                        result=response,
+                        params=params
+                    ), results)
+            progress.update(iter_task, advance=len(chunk))
+
+        return results
+
+    async def async_execute_sequence(self, sequence: Dict, loader: JSONSequenceLoader,
+                                     data_sources: Dict[str, List[Dict]] = None) -> List[Dict]:
+        if httpx is None:
+            raise RuntimeError("httpx est requis pour le mode asynchrone (pip install httpx[http2])")
+
+        data_sources = data_sources or {}
+        self._status_counts.clear()
+        self._preload_data_sources(sequence['steps'], data_sources)
+        results = []
+        semaphore = asyncio.Semaphore(max(self.concurrency, 1))
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        headers = {
+            "Content-Type": "application/json",
+            "x-api-key": self.client.session.headers.get("x-api-key", "")
+        }
+
+        async with httpx.AsyncClient(http2=True, limits=limits, headers=headers,
+                                     timeout=self.client.timeout) as http:
+            if sequence.get('master_iterate_over'):
+                master_source = sequence['master_iterate_over']
+                master_file = sequence.get('master_data_source', '')
+
+                if master_file and Path(master_file).exists():
+                    data_sources[master_source] = CSVDataLoader(master_file).load_data()
+
+                if master_source not in data_sources:
+                    raise ValueError(f"Dataset maitre '{master_source}' non trouve")
+
+                for idx, master_row in enumerate(data_sources[master_source], 1):
+                    self.global_context = {'iteration_row': master_row, 'iteration_index': idx}
+                    batch_results = await self._async_execute_steps(http, semaphore, sequence['steps'],
+                                                                    loader, data_sources)
+                    results.extend(batch_results)
+            else:
+                results = await self._async_execute_steps(http, semaphore, sequence['steps'],
+                                                          loader, data_sources)
+
+        return results
+
+    async def _async_execute_steps(self, http, semaphore, steps: List[Dict],
+                                   loader: JSONSequenceLoader, data_sources: Dict) -> List[Dict]:
+        results = []
+
+        for step in steps:
+            if step.get('condition') and not step.get('iterate_over'):
+                if not loader.evaluate_compiled(step.get('condition_compiled'), self.global_context):
+                    continue
+
+            if step['iterate_over']:
+                if step['iterate_over'] not in data_sources:
+                    raise ValueError(f"Source de donnees '{step['iterate_over']}' non trouvee")
+
+                dataset = data_sources[step['iterate_over']]
+                if step.get('join_on'):
+                    dataset = self._apply_join(dataset, step['join_on'])
+                if step.get('filter_by'):
+                    dataset = self._apply_filter(dataset, step['filter_by'])
+
+                contexts = []
+                for idx, row in enumerate(dataset, 1):
+                    context = ChainMap({'iteration_row': row, 'iteration_index': idx}, self.global_context)
+                    if step.get('condition') and not loader.evaluate_compiled(step.get('condition_compiled'), context):
+                        continue
+                    contexts.append(context)
+
+                step_results = await asyncio.gather(
+                    *[self._async_step(http, semaphore, step, loader, context) for context in contexts]
+                )
+                for r in step_results:
+                    if r:
+                        self._record(r, results)
+            else:
+                result = await self._async_step(http, semaphore, step, loader, self.global_context)
+                if result:
+                    self._record(result, results)
+                    if step['wait_seconds'] > 0:
+                        await asyncio.sleep(step['wait_seconds'])
+
+        return results
+
+    async def _async_step(self, http, semaphore, step: Dict, loader: JSONSequenceLoader,
+                          context: Dict) -> Optional[Dict]:
+        try:
+            if 'params_compiled' in step:
+                params = loader.resolve_compiled(step['params_compiled'], context)
+            else:
+                params = loader.resolve_variables(step['params'], context)
+            params['accountId'] = self.client.account_id
+
+            if not step.get('graphql_query'):
+                raise ValueError(f"Pas de requete GraphQL pour '{step['step_name']}'")
+
+            payload = {"query": step['graphql_query'], "variables": params}
+
+            async with semaphore:
+                response = await http.post(self.client.api_url, json=payload)
+
+            try:
+                body = orjson.loads(response.content) if orjson is not None else response.json()
+            except Exception:
+                body = {"raw_text": response.text}
+
+            response.raise_for_status()
+
+            if "errors" in body:
+                raise Exception(f"GraphQL errors: {body['errors']}")
+
+            if step['store_result_as']:
+                self.global_context[step['store_result_as']] = body
+
+            return ResultRecord(
+                step_name=step['step_name'],
+                operation=step['operation'],
+                status='success',
+                result=body,
+                params=params
+            )
+
+        except Exception as e:
+            if self._verbose:
+                console.print(f"  [red]Erreur: {e}[/red]")
+            return ResultRecord(
+                step_name=step['step_name'],
+                operation=step['operation'],
+                status='error',
+                error=str(e),
+                params=params if 'params' in locals() else {}
+            )
+
     def _apply_join(self, dataset: List[Dict], join_config: Dict) -> List[Dict]:
         local_key = join_config.get('local_key')
         context_key = join_config.get('context_key')
@@ -558,14 +1274,22 @@ class ProvisioningOrchestrator:
         
         if not context_value:
             return dataset
-        
-        filtered = [row for row in dataset if row.get(local_key) == context_value]
+
+        cache_key = (id(dataset), local_key)
+        index = self._join_cache.get(cache_key)
+        if index is None:
+            index = defaultdict(list)
+            for row in dataset:
+                index[row.get(local_key)].append(row)
+            self._join_cache[cache_key] = index
+
+        filtered = index.get(context_value, [])
         console.print(f"[dim]Jointure: {len(dataset)} -> {len(filtered)} elements[/dim]")
         return filtered
     
     def _apply_filter(self, dataset: List[Dict], filter_config: Dict) -> List[Dict]:
-        filtered_data = dataset
-        
+        predicates = []
+
         for field, value_expression in filter_config.items():
             if isinstance(value_expression, str) and value_expression.startswith('${'):
                 var_name = value_expression[2:-1]
@@ -575,11 +1299,17 @@ class ProvisioningOrchestrator:
                 if not filter_value:
                     filter_value = self.global_context.get(var_name)
                 if filter_value:
-                    filtered_data = [row for row in filtered_data if row.get(field) == filter_value]
-                    console.print(f"[dim]Filtre: {field} = {filter_value} -> {len(filtered_data)} elements[/dim]")
+                    predicates.append((field, filter_value))
             else:
-                filtered_data = [row for row in filtered_data if row.get(field) == value_expression]
-                console.print(f"[dim]Filtre: {field} = {value_expression} -> {len(filtered_data)} elements[/dim]")
+                predicates.append((field, value_expression))
+
+        if not predicates:
+            return dataset
+
+        filtered_data = [row for row in dataset
+                        if all(row.get(f) == v for f, v in predicates)]
+        summary = ", ".join(f"{f} = {v}" for f, v in predicates)
+        console.print(f"[dim]Filtre: {summary} -> {len(filtered_data)} elements[/dim]")
         return filtered_data
     
     def _execute_single_step(self, step: Dict, loader: JSONSequenceLoader, 
@@ -587,54 +1317,87 @@ class ProvisioningOrchestrator:
         prefix = "  " if indent else ""
         
         try:
-            if logging.getLogger().isEnabledFor(logging.DEBUG):
+            if self._debug:
                 console.print(f"{prefix}[cyan]Context available: {list(context.keys())}[/cyan]")
                 console.print(f"{prefix}[cyan]Resolving variables...[/cyan]")
             
-            params = loader.resolve_variables(step['params'], context)
+            if 'params_compiled' in step:
+                params = loader.resolve_compiled(step['params_compiled'], context)
+            else:
+                params = loader.resolve_variables(step['params'], context)
             params['accountId'] = self.client.account_id
             
             if not step.get('graphql_query'):
                 raise ValueError(f"Pas de requete GraphQL pour '{step['step_name']}'")
             
-            query = step['graphql_query']
-            result = self.client.execute(query, params)
+            if step.get('_prepared') is not None:
+                result = self.client.execute_prepared(step['_prepared'], params)
+            else:
+                result = self.client.execute(step['graphql_query'], params)
             
             if step['store_result_as']:
-                self.global_context[step['store_result_as']] = result
-                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                with self._context_lock:
+                    self.global_context[step['store_result_as']] = result
+                if self._debug:
                     console.print(f"{prefix}[green]Stored as '{step['store_result_as']}' in global context[/green]")
             
-            console.print(f"{prefix}[green]Succes[/green]")
+            if self._verbose:
+                console.print(f"{prefix}[green]Succes[/green]")
             
-            return {
-                'step_name': step['step_name'],
-                'operation': step['operation'],
-                'status': 'success',
-                'result': result,
-                'params': params,
-                'timestamp': datetime.now().isoformat()
-            }
+            return ResultRecord(
+                step_name=step['step_name'],
+                operation=step['operation'],
+                status='success',
+                result=result,
+                params=params
+            )
             
         except Exception as e:
             console.print(f"{prefix}[red]Erreur: {e}[/red]")
-            return {
-                'step_name': step['step_name'],
-                'operation': step['operation'],
-                'status': 'error',
-                'error': str(e),
-                'params': params if 'params' in locals() else {},
-                'timestamp': datetime.now().isoformat()
-            }
+            return ResultRecord(
+                step_name=step['step_name'],
+                operation=step['operation'],
+                status='error',
+                error=str(e),
+                params=params if 'params' in locals() else {}
+            )
     
-    def save_results(self, results: List[Dict], output_file: Path):
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+    def save_results(self, results: List[ResultRecord], output_file: Path):
+        entries = [asdict(r) for r in results]
+        results_format = self.config.get('files', 'results_format', fallback='json')
+        if results_format == 'msgpack' and msgpack is None:
+            console.print("[yellow]msgpack non disponible, format JSON utilise[/yellow]")
+            results_format = 'json'
+        if results_format == 'msgpack':
+            payload = msgpack.packb(entries, use_bin_type=True)
+        else:
+            pretty = self.config.getboolean('files', 'pretty_results', fallback=False)
+            if orjson is not None:
+                payload = orjson.dumps(entries, option=orjson.OPT_INDENT_2 if pretty else 0)
+            elif pretty:
+                payload = json.dumps(entries, indent=2, ensure_ascii=False).encode('utf-8')
+            else:
+                payload = json.dumps(entries, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        compress = (output_file.suffix == '.gz'
+                    or self.config.getboolean('files', 'compress_results', fallback=False))
+        if compress and output_file.suffix != '.gz':
+            output_file = output_file.with_suffix(output_file.suffix + '.gz')
+        tmp_file = output_file.with_suffix(output_file.suffix + '.tmp')
+        with open(tmp_file, 'wb', buffering=1 << 18) as f:
+            if compress:
+                with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=3) as gz:
+                    gz.write(payload)
+            else:
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, output_file)
         console.print(f"[green]Resultats sauvegardes: {output_file}[/green]")
 
 
-def setup_logging(output_dir: Path, log_level: str):
-    log_file = output_dir / f"execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+def setup_logging(output_dir: Path, log_level: str, run_stamp: str):
+    global DEBUG_ENABLED
+    log_file = output_dir / f"execution_{run_stamp}.log"
     level = getattr(logging, log_level.upper(), logging.INFO)
     logging.basicConfig(
         level=level,
@@ -642,6 +1405,7 @@ def setup_logging(output_dir: Path, log_level: str):
         handlers=[logging.FileHandler(log_file, encoding='utf-8')],
         force=True
     )
+    DEBUG_ENABLED = logging.getLogger().isEnabledFor(logging.DEBUG)
     return log_file
 
 
@@ -657,11 +1421,12 @@ def main():
         output_dir = Path(config.get('files', 'output_dir', fallback='./logs'))
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        log_file = setup_logging(output_dir, config.get('display', 'log_level', fallback='INFO'))
+        run_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        log_file = setup_logging(output_dir, config.get('display', 'log_level', fallback='INFO'), run_stamp)
         
         print_header()
         
-        http_log_file = output_dir / f"http_requests_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        http_log_file = output_dir / f"http_requests_{run_stamp}.ndjson"
         http_logger = HTTPLogger(
             http_log_file,
             enabled=config.getboolean('execution', 'enable_http_logging', fallback=True)
@@ -684,16 +1449,51 @@ def main():
             console.print(f"[cyan]Mode batch active: {sequence['master_iterate_over']}[/cyan]")
         console.print()
         
-        orchestrator = ProvisioningOrchestrator(client, config)
-        results = orchestrator.execute_sequence(sequence, loader, {})
-        
-        results_file = output_dir / f"results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        orchestrator.save_results(results, results_file)
+        results_format = config.get('files', 'results_format', fallback='json')
+        results_ext = 'msgpack' if results_format == 'msgpack' and msgpack is not None else 'json'
+        if config.getboolean('files', 'compress_results', fallback=False):
+            results_ext += '.gz'
+        results_file = output_dir / f"results_{run_stamp}.{results_ext}"
+
+        async_mode = config.getboolean('execution', 'async_mode', fallback=False)
+        if async_mode and httpx is None:
+            console.print("[yellow]httpx non disponible, mode synchrone utilise[/yellow]")
+            async_mode = False
+
+        def run_sequence(orchestrator: ProvisioningOrchestrator) -> List[Dict]:
+            if async_mode:
+                return asyncio.run(orchestrator.async_execute_sequence(sequence, loader, {}))
+            return orchestrator.execute_sequence(sequence, loader, {})
+
+        if results_ext.startswith('msgpack'):
+            orchestrator = ProvisioningOrchestrator(client, config)
+            results = run_sequence(orchestrator)
+        else:
+            results_writer = ResultsWriter(results_file)
+            orchestrator = ProvisioningOrchestrator(client, config, results_writer=results_writer)
+            results = run_sequence(orchestrator)
+            results_writer.close()
         
         http_logger.save()
+        client.close()
+
+        if not results:
+            if not results_ext.startswith('msgpack'):
+                results_file.unlink(missing_ok=True)
+            console.print("[yellow]Aucun resultat produit, rien a sauvegarder.[/yellow]\n")
+            return
         
+        if results_ext.startswith('msgpack'):
+            orchestrator.save_results(results, results_file)
+        else:
+            console.print(f"[green]Resultats sauvegardes: {results_file}[/green]")
+
+        from rich.table import Table
+        from rich import box
+
+        tables = []
         stats = http_logger.get_stats()
-        if stats:
+        if stats and stats.get('total_requests', 0) > 0:
             table = Table(title="Statistiques HTTP", box=box.ROUNDED, width=80)
             table.add_column("Metrique", style="cyan")
             table.add_column("Valeur", style="green", justify="right")
@@ -702,10 +1502,10 @@ def main():
             table.add_row("Echouees", str(stats['failed_requests']))
             table.add_row("Duree totale", f"{stats['total_duration']}s")
             table.add_row("Duree moyenne", f"{stats['avg_duration']}s")
-            console.print(table)
+            tables.append(table)
         
-        success_count = sum(1 for r in results if r['status'] == 'success')
-        error_count = len(results) - success_count
+        success_count = orchestrator.success_count
+        error_count = orchestrator.error_count
         
         summary_table = Table(title="Resume", box=box.DOUBLE_EDGE, width=80)
         summary_table.add_column("Statut", style="bold")
@@ -713,16 +1513,20 @@ def main():
         summary_table.add_row("[green]Reussies[/green]", f"[green]{success_count}[/green]")
         summary_table.add_row("[red]Echouees[/red]", f"[red]{error_count}[/red]")
         summary_table.add_row("[cyan]Total[/cyan]", f"[cyan]{len(results)}[/cyan]")
-        console.print(summary_table)
+        tables.append(summary_table)
+        
+        from rich.console import Group
+        console.print(Group(*tables))
         
         if error_count == 0:
             console.print("\n[bold green]Tous les elements ont ete provisionnes avec succes ![/bold green]\n")
         else:
             console.print(f"\n[bold yellow]{error_count} erreur(s) detectee(s). Consultez les logs.[/bold yellow]\n")
         
-    except Exception as e:
-        console.print(f"\n[bold red]Erreur fatale: {e}[/bold red]")
-        raise
+    except Exception:
+        console.print("\n[bold red]Erreur fatale[/bold red]")
+        console.print_exception(max_frames=5, show_locals=False)
+        sys.exit(1)
 
 
 if __name__ == "__main__":